@@ -8,11 +8,29 @@ const https = require('https');
 const secp256k1 = require('secp256k1');
 const createKeccakHash = require('keccak');
 
-// Keccak256 哈希函数
-function keccak256(data) {
-  return createKeccakHash('keccak256').update(data).digest();
+// 空输入的 Keccak256 摘要，用于确认 OpenSSL 提供的是 Keccak 而不是 SHA3 填充
+const KECCAK256_EMPTY_DIGEST = 'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470';
+
+// 检测 OpenSSL 内置的 KECCAK-256（OpenSSL 3.2+ 提供），不可用时返回 null
+function createOpenSslKeccak256() {
+  try {
+    const digest = crypto.createHash('KECCAK-256').update('').digest('hex');
+    if (digest !== KECCAK256_EMPTY_DIGEST) return null;
+  } catch (e) {
+    return null;
+  }
+  
+  // crypto.hash 为一次性哈希接口（Node 20.12+），不创建 Hash 对象
+  if (typeof crypto.hash === 'function') {
+    return (data) => crypto.hash('KECCAK-256', data, 'buffer');
+  }
+  return (data) => crypto.createHash('KECCAK-256').update(data).digest();
 }
 
+// Keccak256 哈希函数：优先使用 OpenSSL 内置实现，否则回退到 keccak 包
+const keccak256 = createOpenSslKeccak256() ||
+  ((data) => createKeccakHash('keccak256').update(data).digest());
+
 // 全局配置变量
 const RESULT_FILENAME = 'number.txt';
 const REPORT_INTERVAL = 5000; // 报告间隔（毫秒）
@@ -84,32 +102,34 @@ for (let i = 0; i < ALPHABET.length; i++) {
   ALPHABET_MAP[ALPHABET[i]] = i;
 }
 
-// Base58Check 编码
-function base58Encode(buffer) {
-  if (buffer.length === 0) return '';
-  
-  const digits = [0];
-  for (let i = 0; i < buffer.length; i++) {
-    let carry = buffer[i];
-    for (let j = 0; j < digits.length; j++) {
-      carry += digits[j] << 8;
-      digits[j] = carry % 58;
-      carry = (carry / 58) | 0;
-    }
-    while (carry > 0) {
-      digits.push(carry % 58);
-      carry = (carry / 58) | 0;
-    }
-  }
+// TRON 地址固定为 25 字节（0x41 + 20 字节地址 + 4 字节校验和），Base58 编码后固定为 34 个字符
+// （首字节 0x41 保证不存在前导零，首字符恒为 T）
+const ADDRESS_BASE58_LENGTH = 34;
+const LIMB_BASE = 2 ** 40;
+
+// 25 字节地址专用的 Base58 编码
+// 将 200 位整数拆成 5 个 40 位分段做长除法，中间值不超过 2^46，始终在安全整数范围内
+function base58EncodeAddress(buffer) {
+  let l0 = buffer.readUIntBE(0, 5);
+  let l1 = buffer.readUIntBE(5, 5);
+  let l2 = buffer.readUIntBE(10, 5);
+  let l3 = buffer.readUIntBE(15, 5);
+  let l4 = buffer.readUIntBE(20, 5);
   
   let result = '';
-  // 处理前导零
-  for (let i = 0; i < buffer.length && buffer[i] === 0; i++) {
-    result += ALPHABET[0];
-  }
-  // 反转并编码
-  for (let i = digits.length - 1; i >= 0; i--) {
-    result += ALPHABET[digits[i]];
+  for (let i = 0; i < ADDRESS_BASE58_LENGTH; i++) {
+    let t = l0;
+    l0 = Math.floor(t / 58);
+    t = (t - l0 * 58) * LIMB_BASE + l1;
+    l1 = Math.floor(t / 58);
+    t = (t - l1 * 58) * LIMB_BASE + l2;
+    l2 = Math.floor(t / 58);
+    t = (t - l2 * 58) * LIMB_BASE + l3;
+    l3 = Math.floor(t / 58);
+    t = (t - l3 * 58) * LIMB_BASE + l4;
+    l4 = Math.floor(t / 58);
+    // 余数即为当前最低位的 Base58 数字
+    result = ALPHABET[t - l4 * 58] + result;
   }
   
   return result;
@@ -122,26 +142,116 @@ function doubleSha256(buffer) {
   ).digest();
 }
 
-// 从私钥生成 TRON 地址（高性能版本）
-function privateKeyToAddress(privateKeyBuffer) {
-  // 1. 获取未压缩公钥 (65 bytes: 04 + x + y)
-  const publicKey = secp256k1.publicKeyCreate(privateKeyBuffer, false);
+// 公钥输出缓冲区（复用，避免每次生成公钥都分配新数组）
+const publicKeyBuffer = Buffer.alloc(65);
+const publicKeyBody = publicKeyBuffer.subarray(1);
+
+// 地址缓冲区（复用）：0x41 + 20 字节地址 + 4 字节校验和
+const addressBuffer = Buffer.alloc(25);
+addressBuffer[0] = 0x41;
+const addressWithPrefix = addressBuffer.subarray(0, 21);
+
+// 函数：将非负 BigInt 转为 25 字节大端缓冲区（与地址缓冲区直接比较）
+function bigIntToAddressBytes(value) {
+  return Buffer.from(value.toString(16).padStart(50, '0'), 'hex');
+}
+
+// 函数：计算前缀对应的地址整数区间
+// 34 位 Base58 地址的开头字符只取决于 25 字节整数的大小，以 T+prefix 开头的地址恰好构成区间 [lo, hi)，
+// 因此可直接在地址缓冲区上做比较：先比较第 1~4 字节（首字节固定为 0x41）快速排除绝大多数候选，
+// 再与 lo/hi 做完整的 25 字节比较
+function createPrefixRange(prefix) {
+  if (!prefix) return null;
   
-  // 2. Keccak256 哈希公钥（去掉 04 前缀，使用后 64 字节）
-  const hash = keccak256(Buffer.from(publicKey.slice(1)));
+  const pattern = 'T' + prefix;
+  // 区间下界：T+prefix 后补最小数字 '1'（值为 0）
+  let lo = 0n;
+  for (let i = 0; i < ADDRESS_BASE58_LENGTH; i++) {
+    const digit = i < pattern.length ? ALPHABET.indexOf(pattern[i]) : 0;
+    // 前缀含非 Base58 字符（如 0、O、I、l），不可能匹配任何地址：返回空区间
+    if (digit < 0) {
+      const empty = Buffer.alloc(25);
+      return { min: 1, max: 0, lo: empty, hi: empty };
+    }
+    lo = lo * 58n + BigInt(digit);
+  }
+  // 区间上界（不含）
+  const hi = lo + 58n ** BigInt(ADDRESS_BASE58_LENGTH - pattern.length);
   
-  // 3. 取后 20 字节作为地址
-  const addressBytes = hash.slice(-20);
+  // 取 25 字节整数的高 40 位（第 0~4 字节），扣除固定首字节 0x41
+  const base = 0x41n << 32n;
+  return {
+    min: Math.max(0, Number((lo >> 160n) - base)),
+    max: Math.min(0xFFFFFFFF, Number(((hi - 1n) >> 160n) - base)),
+    lo: bigIntToAddressBytes(lo),
+    hi: bigIntToAddressBytes(hi)
+  };
+}
+
+// 后缀的数值判断需满足 58^k * 256 < 2^53，超过该长度时退回到字符串比较
+const MAX_NUMERIC_SUFFIX_LENGTH = 7;
+
+// 函数：计算后缀对应的余数
+// 地址末尾 k 个 Base58 字符即 25 字节整数对 58^k 取模的结果，无需 Base58 编码即可判断
+function createSuffixResidue(suffix) {
+  if (!suffix || suffix.length > MAX_NUMERIC_SUFFIX_LENGTH) return null;
   
-  // 4. 添加 TRON 主网前缀 0x41
-  const addressWithPrefix = Buffer.concat([Buffer.from([0x41]), addressBytes]);
+  let value = 0;
+  for (let i = 0; i < suffix.length; i++) {
+    const digit = ALPHABET.indexOf(suffix[i]);
+    // 后缀含非 Base58 字符，不可能匹配任何地址
+    if (digit < 0) return { modulus: 1, value: -1 };
+    value = value * 58 + digit;
+  }
+  return { modulus: 58 ** suffix.length, value };
+}
+
+// 函数：按地址第 1~4 字节快速预过滤前缀（只依赖地址本身，不需要校验和）
+function addressHeadMatches(buffer, prefixRange) {
+  if (!prefixRange) return true;
+  const head = buffer.readUInt32BE(1);
+  return head >= prefixRange.min && head <= prefixRange.max;
+}
+
+// 函数：直接在 25 字节地址上检查前缀和后缀（不做 Base58 编码，需已写入校验和）
+function addressBufferMatches(buffer, prefixRange, suffixResidue) {
+  if (prefixRange) {
+    if (!addressHeadMatches(buffer, prefixRange)) return false;
+    if (buffer.compare(prefixRange.lo) < 0 || buffer.compare(prefixRange.hi) >= 0) return false;
+  }
   
-  // 5. 计算校验和（双 SHA256 的前 4 字节）
-  const checksum = doubleSha256(addressWithPrefix).slice(0, 4);
+  if (suffixResidue) {
+    const modulus = suffixResidue.modulus;
+    let remainder = 0;
+    for (let i = 0; i < buffer.length; i++) {
+      remainder = (remainder * 256 + buffer[i]) % modulus;
+    }
+    if (remainder !== suffixResidue.value) return false;
+  }
   
-  // 6. Base58 编码
-  const addressBuffer = Buffer.concat([addressWithPrefix, checksum]);
-  return base58Encode(addressBuffer);
+  return true;
+}
+
+// 从私钥计算地址主体（0x41 + 20 字节地址），写入复用的 addressBuffer 前 21 字节
+function writeAddressPayload(privateKeyBuffer) {
+  // 1. 获取未压缩公钥 (65 bytes: 04 + x + y)，由 libsecp256k1 直接写入复用缓冲区
+  secp256k1.publicKeyCreate(privateKeyBuffer, false, publicKeyBuffer);
+  
+  // 2. Keccak256 哈希公钥（去掉 04 前缀，使用后 64 字节，不复制）
+  const hash = keccak256(publicKeyBody);
+  
+  // 3-4. 取后 20 字节作为地址，写入已带 TRON 主网前缀 0x41 的地址缓冲区
+  hash.copy(addressBuffer, 1, 12, 32);
+  
+  return addressBuffer;
+}
+
+// 计算地址校验和（双 SHA256 的前 4 字节），写入 addressBuffer 末尾，得到完整的 25 字节地址
+// 前缀只取决于地址主体的高位字节，因此只需对通过前缀预过滤的候选调用
+function writeAddressChecksum() {
+  doubleSha256(addressWithPrefix).copy(addressBuffer, 21, 0, 4);
+  
+  return addressBuffer;
 }
 
 // 确保结果文件存在
@@ -166,35 +276,32 @@ function formatTime(seconds) {
 function checkAddress(address, prefix, suffix) {
   if (!address || typeof address !== 'string') return false;
   
-  try {
-    // 地址格式：T + 33个字符
-    // 前缀检查（不含 T，区分大小写）
-    const prefixMatch = !prefix || address.substring(1, 1 + prefix.length) === prefix;
-    // 后缀检查（区分大小写）
-    const suffixMatch = !suffix || address.slice(-suffix.length) === suffix;
-    
-    return prefixMatch && suffixMatch;
-  } catch (e) {
-    console.error('检查地址出错:', e);
-    return false;
-  }
+  // 地址格式：T + 33个字符
+  // 前缀检查（不含 T，区分大小写）
+  const prefixMatch = !prefix || address.substring(1, 1 + prefix.length) === prefix;
+  // 后缀检查（区分大小写）
+  const suffixMatch = !suffix || address.slice(-suffix.length) === suffix;
+  
+  return prefixMatch && suffixMatch;
 }
 
-// 函数：高性能生成波场账户
-function generateAccount() {
-  // 生成随机私钥（Buffer 格式，避免字符串转换开销）
-  let privateKeyBuffer;
-  do {
-    privateKeyBuffer = crypto.randomBytes(32);
-  } while (!secp256k1.privateKeyVerify(privateKeyBuffer));
-  
-  // 使用原生库生成地址
-  const address = privateKeyToAddress(privateKeyBuffer);
-  const privateKey = privateKeyBuffer.toString('hex');
-  
-  return { privateKey, address };
+// secp256k1 曲线阶 n，有效私钥需满足 0 < k < n
+const SECP256K1_N = Buffer.from('FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141', 'hex');
+const ZERO_PRIVATE_KEY = Buffer.alloc(32);
+
+// 函数：检查私钥是否在有效范围内
+// 只有首个 32 位字全为 0 或全为 1 时才需要完整比较，其余私钥读取一次即可判定有效
+function isValidPrivateKey(privateKeyBuffer) {
+  const head = privateKeyBuffer.readUInt32BE(0);
+  if (head === 0xFFFFFFFF) return privateKeyBuffer.compare(SECP256K1_N) < 0;
+  if (head === 0) return !privateKeyBuffer.equals(ZERO_PRIVATE_KEY);
+  return true;
 }
 
+// 每批私钥数量：整批随机字节一次性生成，工作进程按批处理私钥
+const KEY_BATCH_SIZE = 1024;
+const keyBatch = Buffer.allocUnsafe(32 * KEY_BATCH_SIZE);
+
 // 函数：将结果追加到单个文件
 function saveToFile(address, privateKey, suffix, stats = null) {
   let content = '';
@@ -240,24 +347,41 @@ function workerProcess(prefix, suffix) {
   
   let attempts = 0;
   const reportInterval = 10000;
+  const prefixRange = createPrefixRange(prefix);
+  const suffixResidue = createSuffixResidue(suffix);
   
   while (true) {
-    attempts++;
+    // 一次性生成整批私钥的随机字节
+    crypto.randomFillSync(keyBatch);
     
-    // 生成新的随机账户
-    const { address, privateKey } = generateAccount();
-    
-    // 检查地址是否符合条件（同时匹配前缀和后缀）
-    if (address && checkAddress(address, prefix, suffix)) {
-      // 将结果发送回主进程
-      process.send({ found: true, address, privateKey, attempts });
+    for (let offset = 0; offset < keyBatch.length; offset += 32) {
+      // 私钥为批缓冲区的视图（Buffer 格式，避免字符串转换开销）
+      const privateKeyBuffer = keyBatch.subarray(offset, offset + 32);
+      if (!isValidPrivateKey(privateKeyBuffer)) continue;
+      attempts++;
       
-      // 继续搜索，重置计数
-      attempts = 0;
+      // 使用原生库生成地址主体，先按高位字节排除不可能匹配前缀的候选（无需计算校验和）
+      writeAddressPayload(privateKeyBuffer);
+      if (!addressHeadMatches(addressBuffer, prefixRange)) continue;
+      
+      // 补全校验和，直接在 25 字节地址上检查前缀和后缀
+      const addressBytes = writeAddressChecksum();
+      if (!addressBufferMatches(addressBytes, prefixRange, suffixResidue)) continue;
+      
+      // 仅对候选地址做 Base58 编码，并做最终的字符串检查
+      const address = base58EncodeAddress(addressBytes);
+      if (checkAddress(address, prefix, suffix)) {
+        // 仅对命中的私钥做十六进制转换，并将结果发送回主进程
+        const privateKey = privateKeyBuffer.toString('hex');
+        process.send({ found: true, address, privateKey, attempts });
+        
+        // 继续搜索，重置计数
+        attempts = 0;
+      }
     }
     
-    // 报告进度
-    if (attempts % reportInterval === 0) {
+    // 每批结束后报告进度
+    if (attempts >= reportInterval) {
       process.send({ 
         found: false, 
         attempts,